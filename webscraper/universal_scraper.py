@@ -8,13 +8,54 @@ import requests
 import time
 import logging
 import re
-from urllib.parse import urljoin
-from bs4 import BeautifulSoup
+import threading
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urljoin, urlsplit
+from requests.adapters import HTTPAdapter
+from requests.compat import chardet
+from urllib3.util.retry import Retry
+from functools import lru_cache
+from itertools import islice
+from lxml import etree
+from lxml import html as lxml_html
+from lxml.cssselect import CSSSelector, SelectorError
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# HTTP (connect, read) timeouts in seconds and the largest page body to accept
+REQUEST_TIMEOUT = (3.05, 10)
+MAX_RESPONSE_BYTES = 5 * 1024 * 1024
+
+# Minimum pause after a Selenium scroll before polling for lazy-loaded content
+LAZY_LOAD_GRACE_SECONDS = 0.3
+
+# lxml refuses str input that carries an XML encoding declaration
+XML_DECLARATION_RE = re.compile(r'^\s*<\?xml[^>]*\?>')
+
+# Price patterns used on every detail page, compiled once
+# Group 1 captures the whole-dollar digits (with thousands separators)
+PRICE_RE = re.compile(r'\$(\d[\d,]*)(?:\.\d{2})?')
+# Case-insensitive 'Price:' label match done entirely inside libxml2
+# (EXSLT re:test would call back into Python for every text node)
+PRICE_LABEL_XPATH = etree.XPath("//text()[contains(translate(., 'PRICE', 'price'), 'price:')]")
+
+# Forum chrome lines (quote/edit/report links) dropped from post bodies
+JUNK_LINE_RE = re.compile(r'quote|edit|report', re.IGNORECASE)
+
+# Detail containers in order of preference as (tag, class, id prefix):
+# div.post_body, td.alt1[id^='post'], div[id^='post_message'],
+# div.item-description, div.content
+DETAIL_CONTAINERS = (
+    ('div', 'post_body', None),
+    ('td', 'alt1', 'post'),
+    ('div', None, 'post_message'),
+    ('div', 'item-description', None),
+    ('div', 'content', None),
+)
+
 # Try to import Selenium (optional)
 try:
     from selenium import webdriver
@@ -22,32 +63,127 @@ try:
     from selenium.webdriver.common.by import By
     from selenium.webdriver.support.ui import WebDriverWait
     from selenium.webdriver.support import expected_conditions as EC
+    from selenium.common.exceptions import TimeoutException
     SELENIUM_AVAILABLE = True
 except ImportError:
     SELENIUM_AVAILABLE = False
     logger.warning("Selenium not available. Browser automation features disabled.")
 
+# Try to import selectolax (optional, faster listing extraction)
+try:
+    from selectolax.lexbor import LexborHTMLParser, SelectolaxError
+    SELECTOLAX_AVAILABLE = True
+except ImportError:
+    SELECTOLAX_AVAILABLE = False
+
+# Try to import requests-cache (optional)
+try:
+    from requests_cache import CachedSession
+    REQUESTS_CACHE_AVAILABLE = True
+except ImportError:
+    REQUESTS_CACHE_AVAILABLE = False
+
+
+def parse_html(html):
+    """
+    Parse page content into an lxml document
+    
+    Args:
+        html: HTML content
+        
+    Returns:
+        Root lxml element (an empty <html> element for blank pages)
+    """
+    try:
+        return lxml_html.document_fromstring(XML_DECLARATION_RE.sub('', html, count=1))
+    except etree.ParserError:
+        return lxml_html.Element('html')
+
+
+@lru_cache(maxsize=None)
+def compile_selector(css):
+    """
+    Translate a CSS selector to a compiled XPath once
+    
+    Args:
+        css: CSS selector string
+        
+    Returns:
+        CSSSelector callable on lxml elements (its .css attribute keeps the source)
+    """
+    return CSSSelector(css, translator='html')
+
+
+# All detail containers as one union XPath, so a single libxml2 pass yields
+# only candidate elements (in document order) for ranking
+DETAIL_SELECTOR = compile_selector(", ".join(
+    tag + (f".{css_class}" if css_class else "") + (f"[id^='{id_prefix}']" if id_prefix else "")
+    for tag, css_class, id_prefix in DETAIL_CONTAINERS
+))
+
 
 class WebScraper:
     """
     Universal web scraper supporting multiple strategies
     """
     
-    def __init__(self, scraping_method='requests'):
+    def __init__(self, scraping_method='requests', max_retries=3, cache_name=None):
         """
         Initialize scraper
         
         Args:
             scraping_method: 'requests' for simple HTTP, 'selenium' for browser automation
+            max_retries: Total attempts per HTTP request, including the first
+            cache_name: Optional SQLite cache file for HTTP responses, reused
+                across runs and revalidated with ETag/Last-Modified (requires requests-cache)
         """
         self.scraping_method = scraping_method
-        self.session = requests.Session()
+        if cache_name:
+            if not REQUESTS_CACHE_AVAILABLE:
+                raise ImportError("requests-cache is not installed. Install with: pip3 install requests-cache")
+            self.session = CachedSession(cache_name, backend='sqlite', expire_after=3600, cache_control=True)
+        else:
+            self.session = requests.Session()
         self.session.headers.update({
             "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
             "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
             "Accept-Language": "en-US,en;q=0.9",
+            "Connection": "keep-alive",
         })
+        # Let urllib3 handle retries (jittered exponential backoff, capped at 30s;
+        # 4xx other than 429 fail immediately) and size the pool for concurrent fetches
+        retry = Retry(
+            total=max(max_retries - 1, 0),
+            backoff_factor=1.0,
+            backoff_jitter=0.5,
+            backoff_max=30,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset(['GET', 'HEAD']),
+            respect_retry_after_header=True,
+        )
+        adapter = HTTPAdapter(max_retries=retry, pool_connections=32, pool_maxsize=32)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
         self.driver = None
+        # Monotonic schedule shared by all workers: the next request may not
+        # start before this time
+        self._rate_lock = threading.Lock()
+        self._next_request_at = 0.0
+    
+    def _wait_for_request_slot(self, delay):
+        """
+        Block until the next request slot, reserving it for the caller
+        
+        Args:
+            delay: Minimum spacing between request starts (seconds)
+        """
+        with self._rate_lock:
+            now = time.monotonic()
+            wait = self._next_request_at - now
+            self._next_request_at = max(now, self._next_request_at) + delay
+        
+        if wait > 0:
+            time.sleep(wait)
     
     def setup_selenium_driver(self):
         """Setup Safari WebDriver for Selenium scraping"""
@@ -59,31 +195,75 @@ class WebScraper:
         self.driver = webdriver.Safari(options=options)
         return self.driver
     
-    def fetch_page_requests(self, url, max_retries=3):
+    def fetch_page_requests(self, url, max_retries=None):
         """
         Fetch page using requests (fast, simple sites)
         
+        Retries with backoff are handled by the session's HTTPAdapter. The body
+        is streamed and the fetch is aborted once it exceeds MAX_RESPONSE_BYTES.
+        
         Args:
             url: URL to fetch
-            max_retries: Number of retry attempts
+            max_retries: Deprecated and ignored; pass max_retries to WebScraper instead
             
         Returns:
             HTML content as string
         """
-        for attempt in range(max_retries):
-            try:
-                logger.info("Fetching: %s (attempt %d)", url, attempt + 1)
-                response = self.session.get(url, timeout=10)
+        if max_retries is not None:
+            warnings.warn(
+                "fetch_page_requests(max_retries=...) is ignored; "
+                "pass max_retries to WebScraper() instead",
+                DeprecationWarning,
+                stacklevel=2,
+            )
+        
+        logger.info("Fetching: %s", url)
+        try:
+            with self.session.get(url, timeout=REQUEST_TIMEOUT, stream=True) as response:
                 response.raise_for_status()
-                return response.text
-            except requests.exceptions.RequestException as e:
-                logger.warning("Attempt %d failed for %s: %s", attempt + 1, url, str(e))
-                if attempt < max_retries - 1:
-                    time.sleep(2 * (attempt + 1))
-                else:
-                    logger.error("Failed to fetch %s after %d attempts", url, max_retries)
-                    raise
-        return None
+                body = bytearray()
+                for chunk in response.iter_content(65536):
+                    body += chunk
+                    if len(body) > MAX_RESPONSE_BYTES:
+                        raise ValueError(f"Response body exceeds {MAX_RESPONSE_BYTES} bytes")
+                # Same fallbacks as response.text: sniff the charset when the
+                # headers carry none, and decode as utf-8 if it is unknown
+                encoding = response.encoding
+                if encoding is None and chardet is not None:
+                    encoding = chardet.detect(bytes(body))['encoding']
+                try:
+                    return body.decode(encoding or 'utf-8', errors='replace')
+                except LookupError:
+                    logger.warning("Unknown charset %r for %s, decoding as utf-8", encoding, url)
+                    return body.decode('utf-8', errors='replace')
+        except (requests.exceptions.RequestException, ValueError) as e:
+            logger.error("Failed to fetch %s: %s", url, str(e))
+            raise
+    
+    def _wait_for_page_idle(self, timeout):
+        """
+        Poll until the document is complete and no new resources have started loading
+        
+        Args:
+            timeout: Maximum time to wait (seconds)
+        """
+        last_resource_count = -1
+        
+        def settled(driver):
+            nonlocal last_resource_count
+            if driver.execute_script("return document.readyState") != "complete":
+                return False
+            resource_count = driver.execute_script(
+                'return window.performance.getEntriesByType("resource").length'
+            )
+            idle = resource_count == last_resource_count
+            last_resource_count = resource_count
+            return idle
+        
+        try:
+            WebDriverWait(self.driver, timeout, poll_frequency=0.25).until(settled)
+        except TimeoutException:
+            logger.debug("Page still loading after %ss, continuing", timeout)
     
     def fetch_page_selenium(self, url, wait_time=3):
         """
@@ -91,7 +271,8 @@ class WebScraper:
         
         Args:
             url: URL to fetch
-            wait_time: Time to wait for page to load
+            wait_time: Maximum time to wait for the page to settle after
+                loading and after each scroll
             
         Returns:
             HTML content as string
@@ -110,14 +291,15 @@ class WebScraper:
         except Exception as e:
             logger.warning("Timeout waiting for page load: %s", str(e))
         
-        # Give page time to fully render
-        time.sleep(wait_time)
+        # Wait until rendering and network activity settle instead of a fixed sleep
+        self._wait_for_page_idle(wait_time)
         
-        # Optional: scroll to trigger lazy-loaded content
-        self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight/2);")
-        time.sleep(1)
-        self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-        time.sleep(1)
+        # Optional: scroll to trigger lazy-loaded content; the short pause gives
+        # scroll handlers a chance to start their requests before polling
+        for position in ("document.body.scrollHeight/2", "document.body.scrollHeight"):
+            self.driver.execute_script(f"window.scrollTo(0, {position});")
+            time.sleep(LAZY_LOAD_GRACE_SECONDS)
+            self._wait_for_page_idle(wait_time)
         
         return self.driver.page_source
     
@@ -137,35 +319,68 @@ class WebScraper:
         else:
             return self.fetch_page_requests(url, **kwargs)
     
-    def parse_generic_listings(self, html, base_url, selectors, filters=None):
+    def parse_generic_listings(self, html, base_url, selectors, filters=None, max_items=None,
+                               exclude_urls=None):
         """
         Generic parser for listing pages
         
         Args:
             html: HTML content
             base_url: Base URL for building full URLs
-            selectors: List of (selector, description) tuples to try
+            selectors: List of (selector, description) tuples to try; selectors
+                may be CSS strings or precompiled CSSSelector objects
             filters: Optional dict with filter functions
+            max_items: Stop once this many listings have been collected
+            exclude_urls: Optional set of full URLs to skip (e.g. listings already
+                taken from earlier pages); they do not count towards max_items
             
         Returns:
             List of listing dictionaries
         """
-        soup = BeautifulSoup(html, 'html.parser')
+        # Lexbor (selectolax) is much faster for plain CSS selection; the lxml
+        # tree is only built if it is unavailable or rejects a selector
+        tree = LexborHTMLParser(html) if SELECTOLAX_AVAILABLE else None
+        doc = None
         listings = []
         seen_urls = set()
+        base = urlsplit(base_url)
+        base_origin = f"{base.scheme}://{base.netloc}"
         
         for selector, description in selectors:
-            logger.info("Trying selector: %s (%s)", selector, description)
-            found_items = soup.select(selector)
+            css = selector.css if isinstance(selector, CSSSelector) else selector
+            logger.debug("Trying selector: %s (%s)", css, description)
+            found_items = None
+            
+            # Titles and links are read lazily so the loop can stop at max_items
+            if tree is not None:
+                try:
+                    found_items = tree.css(css)
+                    item_fields = ((node.text().strip(), node.attributes.get('href') or '')
+                                   for node in found_items)
+                except SelectolaxError:
+                    logger.debug("Lexbor rejected selector %s, using lxml", css)
+            
+            if found_items is None:
+                # Only translate to XPath when the lxml path is actually taken
+                try:
+                    matcher = selector if isinstance(selector, CSSSelector) else compile_selector(selector)
+                except SelectorError as e:
+                    logger.warning("Skipping unsupported selector %s: %s", css, str(e))
+                    continue
+                if doc is None:
+                    doc = parse_html(html)
+                found_items = matcher(doc)
+                item_fields = ((item.text_content().strip(), item.get('href', ''))
+                               for item in found_items)
             
             if found_items:
-                logger.info("✓ Found %d items with selector: %s", len(found_items), selector)
+                logger.info("✓ Found %d items with selector: %s", len(found_items), css)
                 
-                for item in found_items:
+                for title, link in item_fields:
+                    if max_items is not None and len(listings) >= max_items:
+                        break
+                    
                     try:
-                        title = item.get_text().strip()
-                        link = item.get('href', '')
-                        
                         # Skip if no title or link
                         if not title or not link or len(title) < 3:
                             continue
@@ -194,14 +409,18 @@ class WebScraper:
                             if 'prefix_filter' in filters and not filters['prefix_filter'](title):
                                 continue
                         
-                        # Build full URL
-                        if link.startswith('http'):
+                        # Build full URL; root-relative links (the common case) only
+                        # need the base origin prepended, skipping a urljoin parse
+                        if link.startswith(('http://', 'https://')):
                             full_url = link
-                        elif link.startswith('/'):
-                            full_url = urljoin(base_url, link)
+                        elif link.startswith('/') and not link.startswith('//') and '/.' not in link:
+                            full_url = base_origin + link
                         else:
                             full_url = urljoin(base_url, link)
                         
+                        if exclude_urls and full_url in exclude_urls:
+                            continue
+                        
                         seen_urls.add(link)
                         
                         listings.append({
@@ -209,7 +428,7 @@ class WebScraper:
                             'url': full_url
                         })
                         
-                        logger.info("Added: %s", title[:60])
+                        logger.debug("Added: %.60s", title)
                         
                     except Exception as e:
                         logger.warning("Error processing item: %s", str(e))
@@ -231,94 +450,112 @@ class WebScraper:
         Returns:
             Dict with 'price' and 'details'
         """
-        soup = BeautifulSoup(html, 'html.parser')
+        doc = parse_html(html)
         
         # Extract price
         price = "N/A"
-        price_pattern = r'\$[\d,]+(?:\.\d{2})?'
         
         # Look for labeled price
-        price_text = soup.find(string=re.compile(r'Price:', re.IGNORECASE))
-        if price_text:
-            next_text = str(price_text.parent.get_text())
-            price_match = re.search(price_pattern, next_text)
-            if price_match:
-                price = price_match.group()
-        
-        # Fallback: find any price
+        price_texts = PRICE_LABEL_XPATH(doc)
+        if price_texts:
+            price_text = price_texts[0]
+            parent = price_text.getparent()
+            if price_text.is_tail:
+                parent = parent.getparent()
+            # Scan the parent's text nodes lazily rather than joining them
+            # all with text_content() just to find the first price
+            next_texts = parent.itertext() if parent is not None else (price_text,)
+            for next_text in next_texts:
+                price_match = PRICE_RE.search(next_text)
+                if price_match:
+                    price = price_match.group()
+                    break
+        
+        # Fallback: first price over $50 near the top of the page
         if price == "N/A":
-            price_matches = re.findall(price_pattern, html[:5000])
-            if price_matches:
-                valid_prices = [p for p in price_matches if int(p.replace('$', '').replace(',', '').split('.')[0]) > 50]
-                if valid_prices:
-                    price = valid_prices[0]
+            for price_match in PRICE_RE.finditer(html, 0, 5000):
+                if int(price_match.group(1).replace(',', '')) > 50:
+                    price = price_match.group()
+                    break
         
-        # Extract details
+        # Extract details: one pass over candidate containers, keeping the
+        # first sufficiently long element of the most preferred kind
         details = "N/A"
-        detail_selectors = [
-            "div.post_body",
-            "td.alt1[id^='post']",
-            "div[id^='post_message']",
-            "div.item-description",
-            "div.content",
-        ]
-        
-        for selector in detail_selectors:
-            elements = soup.select(selector)
-            for element in elements:
-                text = element.get_text().strip()
-                if len(text) > 100:
-                    lines = [line.strip() for line in text.split('\n') if line.strip()]
-                    cleaned_lines = [l for l in lines if not any(junk in l.lower() for junk in ['quote', 'edit', 'report'])]
-                    details = '\n'.join(cleaned_lines[:15])
+        best_rank = len(DETAIL_CONTAINERS)
+        best_text = None
+        
+        for element in DETAIL_SELECTOR(doc):
+            classes = element.get('class', '').split()
+            element_id = element.get('id', '')
+            
+            for rank, (tag, css_class, id_prefix) in enumerate(DETAIL_CONTAINERS[:best_rank]):
+                if (element.tag == tag
+                        and (css_class is None or css_class in classes)
+                        and (id_prefix is None or element_id.startswith(id_prefix))):
+                    text = element.text_content().strip()
+                    if len(text) > 100:
+                        best_rank, best_text = rank, text
                     break
-            if details != "N/A":
+            
+            if best_rank == 0:
                 break
         
+        if best_text is not None:
+            lines = (line.strip() for line in best_text.splitlines())
+            cleaned_lines = (l for l in lines if l and not JUNK_LINE_RE.search(l))
+            details = '\n'.join(islice(cleaned_lines, 15))
+        
         return {'price': price, 'details': details}
     
-    def scrape_with_details(self, urls, delay=2):
+    def scrape_with_details(self, urls, delay=2, max_workers=8):
         """
         Scrape details from multiple listing URLs
         
         Args:
             urls: List of URLs to scrape
-            delay: Delay between requests (seconds)
+            delay: Minimum time between the starts of consecutive requests
+                (seconds); time spent fetching counts towards it
+            max_workers: Concurrent fetches for the requests method
+                (Selenium shares one browser, so it always runs serially)
             
         Returns:
             List of dicts with title, url, price, details
         """
-        results = []
+        if self.scraping_method == 'selenium':
+            max_workers = 1
         
-        for i, listing in enumerate(urls, 1):
-            logger.info("Fetching details %d/%d: %s", i, len(urls), listing['url'][:50])
+        total = len(urls)
+        
+        def fetch_details(indexed_listing):
+            i, listing = indexed_listing
+            self._wait_for_request_slot(delay)
+            logger.info("Fetching details %d/%d: %s", i, total, listing['url'][:50])
             
             try:
                 html = self.fetch_page(listing['url'])
                 details = self.extract_details(html, listing['url'])
                 
-                results.append({
+                logger.info("Price: %s", details['price'])
+                
+                return {
                     'title': listing['title'],
                     'url': listing['url'],
                     'price': details['price'],
                     'details': details['details']
-                })
-                
-                logger.info("Price: %s", details['price'])
-                
-                if i < len(urls):
-                    time.sleep(delay)
+                }
                     
             except Exception as e:
                 logger.error("Failed to fetch details for %s: %s", listing['url'], str(e))
-                results.append({
+                return {
                     'title': listing['title'],
                     'url': listing['url'],
                     'price': 'N/A',
                     'details': 'Error fetching details'
-                })
+                }
         
-        return results
+        # map() keeps results in listing order regardless of completion order
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(fetch_details, enumerate(urls, 1)))
     
     def close(self):
         """Clean up resources"""
@@ -341,11 +578,34 @@ class WebScraper:
 class FredMirandaScraper(WebScraper):
     """Specialized scraper for Fred Miranda forum"""
     
-    def __init__(self):
+    # Fred Miranda specific selectors, most specific first
+    LISTING_SELECTORS = [
+        (compile_selector("tr td a[href*='/forum/topic/']"), "Topic links in table cells"),
+        (compile_selector("a[href*='/forum/topic/']"), "Any topic links"),
+    ]
+    
+    # Fred Miranda specific filters; scrape_listings adds the (lowercased) keyword
+    LISTING_FILTERS = {
+        'clean_title': lambda t: t.replace(' end', '').strip(),
+        'skip_filter': lambda t, l: t in ('end', '→', '...') or t.isdigit(),
+        'prefix_filter': lambda t: t.startswith(('FS:', 'WTB:', 'FT:')),
+        'keyword_filter': lambda t, k: k in t.lower(),
+    }
+    
+    def __init__(self, requires_js=False):
+        """
+        Initialize scraper
+        
+        Args:
+            requires_js: Load listing pages in the browser too. The forum's
+                listing pages are server-rendered, so by default they are
+                fetched over HTTP and Selenium is kept for detail pages.
+        """
         super().__init__(scraping_method='selenium')
         self.base_url = "https://www.fredmiranda.com/forum/board/10/"
+        self.requires_js = requires_js
     
-    def scrape_listings(self, search_keyword=None, num_pages=4, max_items=50):
+    def scrape_listings(self, search_keyword=None, num_pages=4, max_items=50, delay=2):
         """
         Scrape Fred Miranda Buy & Sell forum
         
@@ -353,60 +613,79 @@ class FredMirandaScraper(WebScraper):
             search_keyword: Filter by keyword (e.g., 'sony', 'nikon')
             num_pages: Number of pages to scrape
             max_items: Maximum listings to return
+            delay: Minimum time between the starts of consecutive page
+                requests (seconds), shared with scrape_with_details
             
         Returns:
             List of listing dictionaries
         """
         all_listings = []
         seen_urls = set()
+        filters = {**self.LISTING_FILTERS, 'keyword': search_keyword.lower() if search_keyword else None}
+        page_urls = [self.base_url] + [f"{self.base_url}{page_num}/" for page_num in range(1, num_pages)]
         
-        for page_num in range(num_pages):
-            # Build page URL
-            if page_num == 0:
-                url = self.base_url
-            else:
-                url = f"{self.base_url}{page_num}/"
-            
-            logger.info("Scraping page %d: %s", page_num + 1, url)
+        # Over HTTP, fetch the next page in the background while the current one
+        # is parsed; the Selenium browser loads one page at a time, so it doesn't
+        if self.requires_js:
+            fetch, fetch_kwargs, prefetch = self.fetch_page_selenium, {'wait_time': 3}, False
+        else:
+            fetch, fetch_kwargs, prefetch = self.fetch_page_requests, {}, True
+        
+        # Set once scraping ends, so a prefetch still waiting for its slot
+        # gives up instead of downloading a page nobody will read
+        done = threading.Event()
+        
+        def fetch_listing_page(page_url):
+            self._wait_for_request_slot(delay)
+            if done.is_set():
+                return None
+            return fetch(page_url, **fetch_kwargs)
+        
+        executor = ThreadPoolExecutor(max_workers=1)
+        try:
+            next_page = None
             
-            try:
-                html = self.fetch_page(url, wait_time=3)
-                
-                # Fred Miranda specific selectors
-                selectors = [
-                    ("tr td a[href*='/forum/topic/']", "Topic links in table cells"),
-                    ("a[href*='/forum/topic/']", "Any topic links"),
-                ]
+            for page_num, url in enumerate(page_urls):
+                logger.info("Scraping page %d: %s", page_num + 1, url)
                 
-                # Fred Miranda specific filters
-                filters = {
-                    'clean_title': lambda t: t.replace(' end', '').strip(),
-                    'skip_filter': lambda t, l: t in ['end', '→', '...'] or t.isdigit(),
-                    'prefix_filter': lambda t: t.startswith('FS:') or t.startswith('WTB:') or t.startswith('FT:'),
-                    'keyword_filter': lambda t, k: k.lower() in t.lower() if k else True,
-                    'keyword': search_keyword
-                }
-                
-                page_listings = self.parse_generic_listings(html, self.base_url, selectors, filters)
-                
-                # Add only new listings
-                for listing in page_listings:
-                    if listing['url'] not in seen_urls:
-                        seen_urls.add(listing['url'])
-                        all_listings.append(listing)
-                        
-                        if len(all_listings) >= max_items:
-                            break
+                page, next_page = next_page, None
                 
-                logger.info("Page %d: Found %d listings (total: %d)", 
-                           page_num + 1, len(page_listings), len(all_listings))
-                
-                if len(all_listings) >= max_items:
-                    break
+                try:
+                    html = page.result() if page else fetch_listing_page(url)
                     
-            except Exception as e:
-                logger.error("Error scraping page %d: %s", page_num + 1, str(e))
-                continue
+                    # Only queue the next page once this one is in hand, so pages
+                    # take rate-limit slots in order and the fetch overlaps the parse
+                    if prefetch and page_num + 1 < len(page_urls):
+                        next_page = executor.submit(fetch_listing_page, page_urls[page_num + 1])
+                    
+                    page_listings = self.parse_generic_listings(
+                        html, self.base_url, self.LISTING_SELECTORS, filters,
+                        max_items=max_items - len(all_listings), exclude_urls=seen_urls,
+                    )
+                    
+                    # Add only new listings
+                    for listing in page_listings:
+                        if listing['url'] not in seen_urls:
+                            seen_urls.add(listing['url'])
+                            all_listings.append(listing)
+                            
+                            if len(all_listings) >= max_items:
+                                break
+                    
+                    logger.info("Page %d: Found %d listings (total: %d)", 
+                               page_num + 1, len(page_listings), len(all_listings))
+                    
+                    if len(all_listings) >= max_items:
+                        break
+                        
+                except Exception as e:
+                    logger.error("Error scraping page %d: %s", page_num + 1, str(e))
+                    continue
+        finally:
+            # Don't wait for an unused prefetch: queued ones are cancelled and a
+            # running one stops after its slot wait
+            done.set()
+            executor.shutdown(wait=False, cancel_futures=True)
         
         return all_listings
 
@@ -414,6 +693,18 @@ class FredMirandaScraper(WebScraper):
 class QuotesScraperExample(WebScraper):
     """Example scraper for quotes.toscrape.com (simple site)"""
     
+    # Compiled once; string() hands back the quote and author text directly
+    # instead of element proxies that would need a text_content() walk
+    QUOTE_XPATH = etree.XPath("//div[contains(concat(' ', normalize-space(@class), ' '), ' quote ')]")
+    QUOTE_TEXT_XPATH = etree.XPath(
+        "string(.//span[contains(concat(' ', normalize-space(@class), ' '), ' text ')])",
+        smart_strings=False,
+    )
+    QUOTE_AUTHOR_XPATH = etree.XPath(
+        "string(.//small[contains(concat(' ', normalize-space(@class), ' '), ' author ')])",
+        smart_strings=False,
+    )
+    
     def __init__(self):
         super().__init__(scraping_method='requests')  # Fast, simple HTTP
         self.base_url = "https://quotes.toscrape.com/"
@@ -422,43 +713,49 @@ class QuotesScraperExample(WebScraper):
         """Scrape quotes from test site"""
         html = self.fetch_page(self.base_url)
         
-        selectors = [("div.quote", "Quote containers")]
-        
-        soup = BeautifulSoup(html, 'html.parser')
+        doc = parse_html(html)
         quotes = []
         
-        quote_divs = soup.select("div.quote")
+        quote_divs = self.QUOTE_XPATH(doc)
         for idx, quote_div in enumerate(quote_divs[:max_items]):
-            quote_text = quote_div.select_one("span.text")
-            author = quote_div.select_one("small.author")
+            quote_text = self.QUOTE_TEXT_XPATH(quote_div)
+            author = self.QUOTE_AUTHOR_XPATH(quote_div)
             
             if quote_text and author:
                 quotes.append({
-                    'title': f"{quote_text.get_text()[:50]}... - {author.get_text()}",
+                    'title': f"{quote_text[:50]}... - {author}",
                     'url': f"{self.base_url}#quote-{idx}",
                     'price': 'N/A',
-                    'details': quote_text.get_text()
+                    'details': quote_text
                 })
         
         return quotes
 
 
 def save_results(listings, filename="scraped_listings.txt"):
-    """Save results to file"""
+    """
+    Save results to file
+    
+    Args:
+        listings: Iterable of listing dicts
+        filename: Output file path
+    """
     try:
+        # Build the whole report first so it is encoded and written in one call
+        parts = [f"Web Scraper Results - {time.strftime('%Y-%m-%d %H:%M:%S')}\n"
+                 f"{'=' * 80}\n\n"]
+        
+        for i, item in enumerate(listings, 1):
+            details = f"Details: {item['details'][:200]}\n" if 'details' in item else ""
+            parts.append(f"ITEM #{i}\n"
+                         f"Title: {item['title']}\n"
+                         f"Price: {item.get('price', 'N/A')}\n"
+                         f"URL: {item['url']}\n"
+                         f"{details}"
+                         f"{'-' * 80}\n\n")
+        
         with open(filename, 'w', encoding='utf-8') as f:
-            f.write(f"Web Scraper Results - {time.strftime('%Y-%m-%d %H:%M:%S')}\n")
-            f.write("=" * 80 + "\n\n")
-            
-            for i, item in enumerate(listings, 1):
-                f.write(f"ITEM #{i}\n")
-                f.write(f"Title: {item['title']}\n")
-                f.write(f"Price: {item.get('price', 'N/A')}\n")
-                f.write(f"URL: {item['url']}\n")
-                if 'details' in item:
-                    details = item['details'][:200] if len(item['details']) > 200 else item['details']
-                    f.write(f"Details: {details}\n")
-                f.write("-" * 80 + "\n\n")
+            f.write(''.join(parts))
         
         logger.info("Results saved to %s", filename)
         return True